@@ -0,0 +1,258 @@
+# encoding:utf-8
+
+# author:dbr/Ben
+# project:tvdb_api
+# repository:http://github.com/dbr/tvdb_api
+# license:unlicense (http://unlicense.org/)
+
+"""Shared test fixtures for tvdb_api.
+
+HTTP responses are served from a cache committed to the repository (see
+FileCache below), so the tests never hit thetvdb.com. All fixtures here are
+read-only once created and safe to construct independently in each
+pytest-xdist worker process, e.g:
+
+    python -m pytest -n auto --dist=loadscope
+
+loadscope keeps each test class on a single worker.
+"""
+
+import os
+import sys
+import tempfile
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Force parent directory onto path
+sys.path.insert(0, os.path.dirname(HERE))
+
+import tvdb_api  # noqa: E402
+
+import requests_cache.backends  # noqa: E402
+import requests_cache.backends.base  # noqa: E402
+
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+import pickle  # noqa: E402
+
+
+IS_PY2 = sys.version_info[0] == 2
+
+if IS_PY2:
+    # Not really but good enough for backwards-compat here
+    FileNotFoundError = IOError
+
+
+# By default tests use persistent (committed to Git) cache.
+# Setting this env-var allows the cache to be populated.
+# This is necessary if, say, adding new test case or TVDB response changes.
+# It is recommended to clear the cache directory before re-populating the cache.
+ALLOW_CACHE_WRITE_ENV_VAR = "TVDB_API_TESTS_ALLOW_CACHE_WRITE"
+ALLOW_CACHE_WRITE = os.getenv(ALLOW_CACHE_WRITE_ENV_VAR, "0") == "1"
+
+HTTP_CACHE_DIR = os.path.join(HERE, "httpcache_py2" if IS_PY2 else "httpcache")
+
+# Python 2 reads its own cache directory (httpcache_py2) which must stay at
+# protocol 2, Python 3 can use the fastest protocol available
+PICKLE_PROTOCOL = 2 if IS_PY2 else pickle.HIGHEST_PROTOCOL
+
+# Prefix of the temporary files cache writes go through. An interrupted
+# cache-population run can leave one behind, so these are never read back
+TMP_FILE_PREFIX = ".tmp-"
+
+
+class FileCacheDict(MutableMapping):
+    def __init__(self, base_dir, mem=None):
+        self._base_dir = base_dir
+        # Files do not change during a test run, so keep every unpickled
+        # item around rather than re-reading it on each lookup. Dicts
+        # backed by the same directory can share this
+        self._mem = {} if mem is None else mem
+
+    def __getitem__(self, key, _load=pickle.load):
+        try:
+            return self._mem[key]
+        except KeyError:
+            pass
+        path = os.path.join(self._base_dir, key)
+        try:
+            with open(path, "rb") as f:
+                data = _load(f)
+                self._mem[key] = data
+                return data
+        except FileNotFoundError:
+            if not ALLOW_CACHE_WRITE:
+                raise RuntimeError("No cache file found %s" % path)
+            raise KeyError
+
+    def __contains__(self, key):
+        # Checked without __getitem__, which errors for uncached keys
+        return key in self._mem or os.path.exists(os.path.join(self._base_dir, key))
+
+    def __setitem__(self, key, item):
+        if ALLOW_CACHE_WRITE:
+            path = os.path.join(self._base_dir, key)
+            # Write to a temporary file and rename it into place, so parallel
+            # workers populating the cache never see a half-written file
+            fd, tmp_path = tempfile.mkstemp(dir=self._base_dir, prefix=TMP_FILE_PREFIX)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(item, f, protocol=PICKLE_PROTOCOL)
+            if IS_PY2:
+                if os.path.exists(path):
+                    os.remove(path)  # os.rename cannot overwrite on Windows
+                os.rename(tmp_path, path)
+            else:
+                os.replace(tmp_path, path)
+            self._mem[key] = item
+        else:
+            raise RuntimeError(
+                "Requested uncached URL and $%s not set to 1" % (ALLOW_CACHE_WRITE_ENV_VAR)
+            )
+
+    def __delitem__(self, key):
+        raise RuntimeError("Removing items from test-cache not supported")
+
+    def __len__(self):
+        return len(self._mem)
+
+    def __iter__(self):
+        return iter(self._mem)
+
+    def preload(self):
+        """Reads every cache file into memory in one pass over the directory,
+        so individual lookups never touch the disk
+        """
+        paths = [
+            (name, os.path.join(self._base_dir, name))
+            for name in os.listdir(self._base_dir)
+            if not name.startswith(TMP_FILE_PREFIX)
+        ]
+        if hasattr(os, "posix_fadvise"):
+            # Let the kernel start reading everything while earlier files
+            # are being unpickled. Each file is closed straight away so only
+            # one is open at a time
+            for _name, path in paths:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+        load = pickle.load
+        for name, path in paths:
+            with open(path, "rb") as f:
+                self._mem[name] = load(f)
+
+    def clear(self):
+        raise NotImplementedError()
+
+    def __str__(self):
+        return str(dict(self.items()))
+
+
+class FileCache(requests_cache.backends.base.BaseCache):
+    # Same cache-key algorithm as the sessions created by tvdb_api itself
+    create_key = tvdb_api.create_key
+
+    def __init__(self, _name, fc_base_dir, **options):
+        super(FileCache, self).__init__(**options)
+        # Both mappings are stored in the same directory, so share the
+        # in-memory copy too rather than loading files twice
+        mem = {}
+        self.responses = FileCacheDict(base_dir=fc_base_dir, mem=mem)
+        self.keys_map = FileCacheDict(base_dir=fc_base_dir, mem=mem)
+
+
+requests_cache.backends.registry['tvdb_api_file_cache'] = FileCache
+
+
+_test_cache_session = None
+
+
+def get_test_cache_session():
+    """Returns the CachedSession backed by the committed HTTP cache. The same
+    session is shared by every Tvdb instance in the test run
+    """
+    global _test_cache_session
+    if _test_cache_session is not None:
+        return _test_cache_session
+
+    sess = requests_cache.CachedSession(
+        backend="tvdb_api_file_cache",
+        fc_base_dir=HTTP_CACHE_DIR,
+        include_get_headers=True,
+        allowable_codes=(200, 404),
+    )
+    if not ALLOW_CACHE_WRITE:
+        # Cache population runs stay lazy so newly written files are picked up
+        sess.cache.responses.preload()
+    _test_cache_session = sess
+    return sess
+
+
+@pytest.fixture(scope="session")
+def cache_session():
+    """Cached session for tests which need to construct their own Tvdb
+    """
+    return get_test_cache_session()
+
+
+@pytest.fixture(scope="session")
+def tvdb():
+    """Tvdb instance shared by all tests using the default configuration
+    """
+    return tvdb_api.Tvdb(cache=get_test_cache_session(), banners=False)
+
+
+@pytest.fixture(scope="session")
+def tvdb_banners():
+    return tvdb_api.Tvdb(cache=get_test_cache_session(), banners=True)
+
+
+@pytest.fixture(scope="session")
+def tvdb_actors():
+    return tvdb_api.Tvdb(cache=get_test_cache_session(), actors=True)
+
+
+@pytest.fixture(scope="session")
+def tvdb_dvd():
+    return tvdb_api.Tvdb(cache=get_test_cache_session(), dvdorder=True)
+
+
+@pytest.fixture(scope="session")
+def tvdb_by_lang():
+    """One Tvdb instance per language used by the tests, keyed by language code
+    """
+    return {
+        lang: tvdb_api.Tvdb(cache=get_test_cache_session(), language=lang)
+        for lang in ("en", "fr", "es", "it", "zh")
+    }
+
+
+@pytest.fixture(scope="class")
+def scrubs_show(tvdb):
+    return tvdb['scrubs']
+
+
+@pytest.fixture(scope="class")
+def earl_show(tvdb):
+    return tvdb['My Name Is Earl']
+
+
+@pytest.fixture(scope="class")
+def cnnnn_show(tvdb):
+    return tvdb['CNNNN']
+
+
+@pytest.fixture(scope="class")
+def cnnnn_season(cnnnn_show):
+    return cnnnn_show[1]
+
+
+@pytest.fixture(scope="class")
+def cnnnn_episode(cnnnn_season):
+    return cnnnn_season[1]
@@ -10,9 +10,13 @@
 """
 
 import os
+import re
+import copy
+import pickle
 import sys
-import types
 import datetime
+import time
+import threading
 import pytest
 
 # Force parent directory onto path
@@ -27,154 +31,54 @@ from tvdb_api import (  # noqa: E402
 )
 
 
-import requests_cache.backends  # noqa: E402
-import requests_cache.backends.base  # noqa: E402
-
-
-try:
-    from collections.abc import MutableMapping
-except ImportError:
-    from collections import MutableMapping
-
-import pickle  # noqa: E402
-
-
-IS_PY2 = sys.version_info[0] == 2
-
-if IS_PY2:
-    # Not really but good enough for backwards-compat here
-    FileNotFoundError = IOError
-
-
-# By default tests use persistent (committed to Git) cache.
-# Setting this env-var allows the cache to be populated.
-# This is necessary if, say, adding new test case or TVDB response changes.
-# It is recommended to clear the cache directory before re-populating the cache.
-ALLOW_CACHE_WRITE_ENV_VAR = "TVDB_API_TESTS_ALLOW_CACHE_WRITE"
-ALLOW_CACHE_WRITE = os.getenv(ALLOW_CACHE_WRITE_ENV_VAR, "0") == "1"
-
-
-class FileCacheDict(MutableMapping):
-    def __init__(self, base_dir):
-        self._base_dir = base_dir
-
-    def __getitem__(self, key):
-        path = os.path.join(self._base_dir, key)
-        try:
-            with open(path, "rb") as f:
-                data = pickle.load(f)
-                return data
-        except FileNotFoundError:
-            if not ALLOW_CACHE_WRITE:
-                raise RuntimeError("No cache file found %s" % path)
-            raise KeyError
-
-    def __setitem__(self, key, item):
-        if ALLOW_CACHE_WRITE:
-            path = os.path.join(self._base_dir, key)
-            with open(path, "wb") as f:
-                # Dump with protocol 2 to allow Python 2.7 support
-                f.write(pickle.dumps(item, protocol=2))
-        else:
-            raise RuntimeError(
-                "Requested uncached URL and $%s not set to 1" % (ALLOW_CACHE_WRITE_ENV_VAR)
-            )
-
-    def __delitem__(self, key):
-        raise RuntimeError("Removing items from test-cache not supported")
-
-    def __len__(self):
-        raise NotImplementedError()
-
-    def __iter__(self):
-        raise NotImplementedError()
-
-    def clear(self):
-        raise NotImplementedError()
-
-    def __str__(self):
-        return str(dict(self.items()))
-
-
-class FileCache(requests_cache.backends.base.BaseCache):
-    def __init__(self, _name, fc_base_dir, **options):
-        super(FileCache, self).__init__(**options)
-        self.responses = FileCacheDict(base_dir=fc_base_dir)
-        self.keys_map = FileCacheDict(base_dir=fc_base_dir)
-
-
-requests_cache.backends.registry['tvdb_api_file_cache'] = FileCache
-
-
-def get_test_cache_session():
-    here = os.path.dirname(os.path.abspath(__file__))
-    additional = "_py2" if sys.version_info[0] == 2 else ""
-    sess = requests_cache.CachedSession(
-        backend="tvdb_api_file_cache",
-        fc_base_dir=os.path.join(here, "httpcache%s" % additional),
-        include_get_headers=True,
-        allowable_codes=(200, 404),
-    )
-    sess.cache.create_key = types.MethodType(tvdb_api.create_key, sess.cache)
-    return sess
+# Artwork URLs returned by tvdb_api are fully qualified
+is_artwork_url = re.compile(r"http://").match
 
 
 class TestTvdbBasic:
-    # Used to store the cached instance of Tvdb()
-    t = None
-
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), banners=False)
-
-    def test_different_case(self):
+    def test_different_case(self, tvdb):
         """Checks the auto-correction of show names is working.
         It should correct the weirdly capitalised 'sCruBs' to 'Scrubs'
         """
-        assert self.t['scrubs'][1][4]['episodeName'] == 'My Old Lady'
-        assert self.t['sCruBs']['seriesName'] == 'Scrubs'
+        assert tvdb['scrubs'][1][4]['episodeName'] == 'My Old Lady'
+        assert tvdb['sCruBs']['seriesName'] == 'Scrubs'
 
-    def test_spaces(self):
+    def test_spaces(self, tvdb):
         """Checks shownames with spaces
         """
-        assert self.t['My Name Is Earl']['seriesName'] == 'My Name Is Earl'
-        assert self.t['My Name Is Earl'][1][4]['episodeName'] == 'Faked My Own Death'
+        assert tvdb['My Name Is Earl']['seriesName'] == 'My Name Is Earl'
+        assert tvdb['My Name Is Earl'][1][4]['episodeName'] == 'Faked My Own Death'
 
-    def test_numeric(self):
+    def test_numeric(self, tvdb):
         """Checks numeric show names
         """
-        assert self.t['24'][2][20]['episodeName'] == 'Day 2: 3:00 A.M. - 4:00 A.M.'
-        assert self.t['24']['seriesName'] == '24'
+        assert tvdb['24'][2][20]['episodeName'] == 'Day 2: 3:00 A.M. - 4:00 A.M.'
+        assert tvdb['24']['seriesName'] == '24'
 
-    def test_show_iter(self):
+    def test_show_iter(self, scrubs_show):
         """Iterating over a show returns each seasons
         """
-        assert len([season for season in self.t['scrubs']]) == 10
+        assert len([season for season in scrubs_show]) == 10
 
-    def test_season_iter(self):
+    def test_season_iter(self, scrubs_show):
         """Iterating over a show returns episodes
         """
-        assert len([episode for episode in self.t['scrubs'][1]]) == 24
+        assert len([episode for episode in scrubs_show[1]]) == 24
 
-    def test_get_episode_overview(self):
+    def test_get_episode_overview(self, scrubs_show):
         """Checks episode overview is retrieved correctly.
         """
-        assert self.t['Scrubs'][1][6]['overview'].startswith(
+        assert scrubs_show[1][6]['overview'].startswith(
             'Dr. Cox is still facing the threat of suspension'
         )
 
-        try:
-            self.t['Scrubs']['something nonsensical']
-        except tvdb_attributenotfound:
-            pass  # good
-        else:
-            raise AssertionError("Expected attribute error")
+        with pytest.raises(tvdb_attributenotfound):
+            scrubs_show['something nonsensical']
 
-    def test_get_parent(self):
+    def test_get_parent(self, scrubs_show):
         """Check accessing series from episode instance
         """
-        show = self.t['Scrubs']
+        show = scrubs_show
         season = show[1]
         episode = show[1][1]
 
@@ -182,269 +86,420 @@ class TestTvdbBasic:
         assert episode.season == season
         assert episode.season.show == show
 
-    def test_no_season(self):
-        show = self.t['Katekyo Hitman Reborn']
+    def test_no_season(self, tvdb):
+        show = tvdb['Katekyo Hitman Reborn']
         print(tvdb_api)
         print(show[1][1])
 
+    def test_corrections_ignore_case(self, cache_session):
+        """Check differently cased show names reuse the first search result
+        """
+        t = tvdb_api.Tvdb(cache=cache_session)
+        show = t['Scrubs']
 
-class TestTvdbErrors:
-    t = None
+        def fail_search(series):
+            raise AssertionError("searched again for %s" % series)
 
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), banners=False)
+        t.search = fail_search
+        assert t['scrubs'] is show
+        assert t.corrections == {'scrubs': 76156}
 
-    def test_seasonnotfound(self):
-        """Checks exception is thrown when season doesn't exist.
+    def test_corrections_set_by_hand(self, cache_session):
+        """Check corrections set by hand with capital letters still apply
         """
-        with pytest.raises(tvdb_seasonnotfound):
-            self.t['Scrubs'][42]
+        t = tvdb_api.Tvdb(cache=cache_session)
+        t.corrections['Some Show'] = 76156
+        assert t['Some Show']['seriesName'] == 'Scrubs'
+        assert t.batch_get(['Some Show'])['Some Show'] is t['Some Show']
 
-    def test_shownotfound(self):
-        """Checks exception is thrown when episode doesn't exist.
+    def test_show_data_loaded_once(self, cache_session):
+        """Check a show is not reloaded when another name resolves to the same ID
         """
-        with pytest.raises(tvdb_shownotfound):
-            self.t['the fake show thingy']
+        t = tvdb_api.Tvdb(cache=cache_session)
+        show = t['scrubs']
+        t.corrections.clear()
+
+        def fail_get_show_data(sid, language):
+            raise AssertionError("reloaded show %s" % sid)
 
-    def test_shownotfound_by_id(self):
-        """Checks exception is thrown when episode doesn't exist.
+        t._getShowData = fail_get_show_data
+        assert t['scrubs'] is show
+
+
+class TestTvdbErrors:
+    def test_seasonnotfound(self, scrubs_show):
+        """Checks exception is thrown when season doesn't exist.
+        """
+        with pytest.raises(tvdb_seasonnotfound):
+            scrubs_show[42]
+
+    @pytest.mark.parametrize("bad", ['the fake show thingy', 999999999999999999999999])
+    def test_shownotfound(self, tvdb, bad):
+        """Checks exception is thrown when show doesn't exist, by name or by ID.
         """
         with pytest.raises(tvdb_shownotfound):
-            self.t[999999999999999999999999]
+            tvdb[bad]
 
-    def test_episodenotfound(self):
+    def test_episodenotfound(self, scrubs_show):
         """Checks exception is raised for non-existent episode
         """
         with pytest.raises(tvdb_episodenotfound):
-            self.t['Scrubs'][1][30]
+            scrubs_show[1][30]
 
-    def test_attributenamenotfound(self):
+    def test_attributenamenotfound(self, scrubs_show):
         """Checks exception is thrown for if an attribute isn't found.
         """
         with pytest.raises(tvdb_attributenotfound):
-            self.t['Scrubs'][1][6]['afakeattributething']
-            self.t['Scrubs']['afakeattributething']
+            scrubs_show[1][6]['afakeattributething']
+            scrubs_show['afakeattributething']
 
 
 class TestTvdbSearch:
-    # Used to store the cached instance of Tvdb()
-    t = None
-
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), banners=False)
-
-    def test_search_len(self):
+    def test_search_len(self, earl_show):
         """There should be only one result matching
         """
-        assert len(self.t['My Name Is Earl'].search('Faked My Own Death')) == 1
+        assert len(earl_show.search('Faked My Own Death')) == 1
 
-    def test_search_checkname(self):
+    def test_search_checkname(self, scrubs_show, earl_show):
         """Checks you can get the episode name of a search result
         """
-        assert self.t['Scrubs'].search('my first')[0]['episodeName'] == 'My First Day'
+        assert scrubs_show.search('my first')[0]['episodeName'] == 'My First Day'
         assert (
-            self.t['My Name Is Earl'].search('Faked My Own Death')[0]['episodeName']
+            earl_show.search('Faked My Own Death')[0]['episodeName']
             == 'Faked My Own Death'
         )
 
-    def test_search_multiresults(self):
+    def test_search_multiresults(self, scrubs_show):
         """Checks search can return multiple results
         """
-        assert len(self.t['Scrubs'].search('my first')) >= 3
+        assert len(scrubs_show.search('my first')) >= 3
 
-    def test_search_no_params_error(self):
+    def test_search_no_params_error(self, scrubs_show):
         """Checks not supplying search info raises TypeError"""
         with pytest.raises(TypeError):
-            self.t['Scrubs'].search()
+            scrubs_show.search()
 
-    def test_search_season(self):
+    def test_search_season(self, scrubs_show):
         """Checks the searching of a single season"""
-        assert len(self.t['Scrubs'][1].search("First")) == 3
+        assert len(scrubs_show[1].search("First")) == 3
 
-    def test_search_show(self):
+    def test_search_show(self, tvdb):
         """Checks the searching of an entire show"""
-        assert len(self.t['CNNNN'].search('CNNNN', key='episodeName')) == 3
+        assert len(tvdb['CNNNN'].search('CNNNN', key='episodeName')) == 3
 
-    def test_aired_on(self):
+    def test_aired_on(self, scrubs_show):
         """Tests aired_on show method"""
-        sr = self.t['Scrubs'].aired_on(datetime.date(2001, 10, 2))
+        sr = scrubs_show.aired_on(datetime.date(2001, 10, 2))
         assert len(sr) == 1
         assert sr[0]['episodeName'] == u'My First Day'
 
-        try:
-            sr = self.t['Scrubs'].aired_on(datetime.date(1801, 1, 1))
-        except tvdb_episodenotfound:
-            pass  # Good
-        else:
-            raise AssertionError("expected episode not found exception")
-
+        with pytest.raises(tvdb_episodenotfound):
+            scrubs_show.aired_on(datetime.date(1801, 1, 1))
 
-class TestTvdbData:
-    # Used to store the cached instance of Tvdb()
-    t = None
+    def test_aired_on_partial_date(self, scrubs_show):
+        """Tests aired_on still matches partial dates, like search does"""
+        expected = scrubs_show.search('2001-10', key='firstAired')
+        assert len(expected) > 1
+        assert scrubs_show.aired_on('2001-10') == expected
 
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), banners=False)
 
-    def test_episode_data(self):
+class TestTvdbData:
+    def test_episode_data(self, tvdb):
         """Check the firstaired value is retrieved
         """
-        assert self.t['lost']['firstAired'] == '2004-09-22'
-
+        assert tvdb['lost']['firstAired'] == '2004-09-22'
 
-class TestTvdbMisc:
-    # Used to store the cached instance of Tvdb()
-    t = None
+    def test_without_orjson(self, cache_session, monkeypatch):
+        """Check responses are decoded by requests when orjson is not installed
+        """
+        monkeypatch.setattr(tvdb_api, 'orjson', None)
+        t = tvdb_api.Tvdb(cache=cache_session)
+        assert t['scrubs'][1][1]['episodeName'] == 'My First Day'
 
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), banners=False)
 
-    def test_repr_show(self):
+class TestTvdbMisc:
+    def test_repr_show(self, cnnnn_show):
         """Check repr() of Season
         """
         assert (
-            repr(self.t['CNNNN']).replace("u'", "'")
+            repr(cnnnn_show).replace("u'", "'")
             == "<Show 'Chaser Non-Stop News Network (CNNNN)' (containing 3 seasons)>"
         )
 
-    def test_repr_season(self):
+    def test_repr_season(self, cnnnn_season):
         """Check repr() of Season
         """
-        assert repr(self.t['CNNNN'][1]) == "<Season instance (containing 9 episodes)>"
+        assert repr(cnnnn_season) == "<Season instance (containing 9 episodes)>"
 
-    def test_repr_episode(self):
+    def test_repr_episode(self, cnnnn_episode):
         """Check repr() of Episode
         """
-        assert repr(self.t['CNNNN'][1][1]).replace("u'", "'") == "<Episode 01x01 - 'Terror Alert'>"
+        assert repr(cnnnn_episode).replace("u'", "'") == "<Episode 01x01 - 'Terror Alert'>"
 
-    def test_available_langs(self):
+    def test_available_langs(self, tvdb):
         """Check available_languages returns something sane looking
         """
-        langs = self.t.available_languages()
+        langs = tvdb.available_languages()
         print(langs)
         assert "en" in langs
 
 
-class TestTvdbLanguages:
-    def test_episode_name_french(self):
-        """Check episode data is in French (language="fr")
+class TestTvdbAuthorization:
+    @pytest.mark.parametrize(
+        "url,expect_authorize",
+        [
+            # In the test cache, no token is needed
+            ('https://api.thetvdb.com/series/76156', False),
+            # Not in the test cache, so needs a fresh token
+            ('https://api.thetvdb.com/series/1', True),
+        ],
+    )
+    def test_expired_token(self, cache_session, url, expect_authorize):
+        """Checks an expired token is only renewed when loading an uncached URL
         """
-        t = tvdb_api.Tvdb(cache=get_test_cache_session(), language="fr")
-        assert t['scrubs'][1][1]['episodeName'] == "Mon premier jour"
-        assert t['scrubs']['overview'].startswith(u"J.D. est un jeune m\xe9decin qui d\xe9bute")
+        t = tvdb_api.Tvdb(cache=cache_session)
+        t._Tvdb__authorized = True
+        t._Tvdb__token_expiry = time.time() - 1
+
+        calls = []
+        t.authorize = lambda: calls.append(True)
+        t._authorizeUnlessCached(url, 'en')
+        assert calls == ([True] if expect_authorize else [])
 
-    def test_episode_name_spanish(self):
-        """Check episode data is in Spanish (language="es")
+    def test_valid_token(self, cache_session):
+        """Checks an unexpired token is used without checking the cache
         """
-        t = tvdb_api.Tvdb(cache=get_test_cache_session(), language="es")
-        assert t['scrubs'][1][1]['episodeName'] == u'Mi primer día'
-        assert t['scrubs']['overview'].startswith(u'Scrubs es una divertida comedia')
+        t = tvdb_api.Tvdb(cache=cache_session)
+        t._Tvdb__authorized = True
+        t._Tvdb__token_expiry = time.time() + 60
 
-    def test_multilanguage_selection(self):
-        """Check selected language is used
+        calls = []
+        t.authorize = lambda: calls.append(True)
+        t._authorizeUnlessCached('https://api.thetvdb.com/series/1', 'en')
+        assert calls == []
+
+    def test_headers_after_authorize(self, cache_session):
+        """Checks request headers copied before logging in aren't used afterwards
         """
-        t_en = tvdb_api.Tvdb(cache=get_test_cache_session(), language="en")
-        t_it = tvdb_api.Tvdb(cache=get_test_cache_session(), language="it")
+        t = tvdb_api.Tvdb(cache=cache_session)
+        assert 'Authorization' not in t._headersForLanguage('en')
+        # As left by another thread copying the headers while authorize() ran
+        t.headers['Authorization'] = 'Bearer abc'
+        headers = t._headersForLanguage('en')
+        assert headers['Authorization'] == 'Bearer abc'
+        assert headers['Accept-Language'] == 'en'
 
-        assert t_en['dexter'][1][2]['episodeName'] == "Crocodile"
-        assert t_it['dexter'][1][2]['episodeName'] == "Lacrime di coccodrillo"
+
+class TestTvdbLanguages:
+    @pytest.mark.parametrize(
+        "lang,show,season,episode,expected",
+        [
+            ("fr", "scrubs", 1, 1, u"Mon premier jour"),
+            ("es", "scrubs", 1, 1, u"Mi primer día"),
+            ("en", "dexter", 1, 2, u"Crocodile"),
+            ("it", "dexter", 1, 2, u"Lacrime di coccodrillo"),
+        ],
+    )
+    def test_episode_name(self, tvdb_by_lang, lang, show, season, episode, expected):
+        """Check episode data is in the selected language
+        """
+        assert tvdb_by_lang[lang][show][season][episode]['episodeName'] == expected
+
+    @pytest.mark.parametrize(
+        "lang,expected_start",
+        [
+            ("fr", u"J.D. est un jeune m\xe9decin qui d\xe9bute"),
+            ("es", u"Scrubs es una divertida comedia"),
+        ],
+    )
+    def test_show_overview(self, tvdb_by_lang, lang, expected_start):
+        """Check show data is in the selected language
+        """
+        assert tvdb_by_lang[lang]['scrubs']['overview'].startswith(expected_start)
 
 
 class TestTvdbUnicode:
-    def test_search_in_chinese(self):
+    def test_search_in_chinese(self, tvdb_by_lang):
         """Check searching for show with language=zh returns Chinese seriesname
         """
-        t = tvdb_api.Tvdb(cache=get_test_cache_session(), language="zh")
+        t = tvdb_by_lang["zh"]
         show = t[u'T\xecnh Ng\u01b0\u1eddi Hi\u1ec7n \u0110\u1ea1i']
         assert type(show) == tvdb_api.Show
         assert show['seriesName'] == u'T\xecnh Ng\u01b0\u1eddi Hi\u1ec7n \u0110\u1ea1i'
 
     @pytest.mark.skip('Новое API не возвращает сразу все языки')
-    def test_search_in_all_languages(self):
+    def test_search_in_all_languages(self, cache_session):
         """Check search_all_languages returns Chinese show, with language=en
         """
-        t = tvdb_api.Tvdb(cache=get_test_cache_session(), search_all_languages=True, language="en")
+        t = tvdb_api.Tvdb(cache=cache_session, search_all_languages=True, language="en")
         show = t[u'T\xecnh Ng\u01b0\u1eddi Hi\u1ec7n \u0110\u1ea1i']
         assert type(show) == tvdb_api.Show
         assert show['seriesName'] == u'Virtues Of Harmony II'
 
 
 class TestTvdbBanners:
-    # Used to store the cached instance of Tvdb()
-    t = None
-
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), banners=True)
-
-    def test_have_banners(self):
+    def test_have_banners(self, tvdb_banners):
         """Check banners at least one banner is found
         """
-        assert len(self.t['scrubs']['_banners']) > 0
+        assert len(tvdb_banners['scrubs']['_banners']) > 0
 
-    def test_banner_url(self):
+    def test_banner_url(self, tvdb_banners):
         """Checks banner URLs start with http://
         """
-        for banner_type, banner_data in self.t['scrubs']['_banners'].items():
-            for res, res_data in banner_data.items():
-                if res != 'raw':
-                    for bid, banner_info in res_data.items():
-                        assert banner_info['_bannerpath'].startswith("http://")
+        paths = [
+            banner_info['_bannerpath']
+            for banner_data in tvdb_banners['scrubs']['_banners'].values()
+            for res, res_data in banner_data.items()
+            if res != 'raw'
+            for banner_info in res_data.values()
+        ]
+        assert all(map(is_artwork_url, paths))
+
+    def test_parallel_banners(self, tvdb_banners, cache_session):
+        """Checks banners loaded with parallel_requests match the serially loaded ones
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, banners=True, parallel_requests=True)
+        assert t['scrubs']['_banners'] == tvdb_banners['scrubs']['_banners']
+
+    def test_parallel_banner_types(self, cache_session, monkeypatch):
+        """Checks the banners of each artwork type are loaded on more than one thread
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, banners=True, parallel_requests=True)
+        getetsrc = t._getetsrc
+        threads = set()
+
+        def recording_getetsrc(url, language=None):
+            if 'keyType=' in url:
+                threads.add(threading.current_thread().ident)
+                # Keeps each thread busy long enough for the others to take a request
+                time.sleep(0.05)
+            return getetsrc(url, language=language)
+
+        monkeypatch.setattr(t, '_getetsrc', recording_getetsrc)
+        assert len(t['scrubs']['_banners']) > 0
+        assert len(threads) > 1
+
+    def test_banners_after_eviction(self, cache_session, monkeypatch):
+        """Checks lazily loaded banners still load onto a show evicted from Tvdb.shows
+        """
+        monkeypatch.setattr(tvdb_api.ShowContainer, '_max_shows', 1)
+        t = tvdb_api.Tvdb(cache=cache_session, banners=True)
+        show = t['scrubs']
+        t.shows[-1] = tvdb_api.Show()
+        assert 76156 not in t.shows
+        assert len(show['_banners']) > 0
+        assert 76156 not in t.shows
 
     @pytest.mark.skip('В новом API нет картинки у эпизода')
-    def test_episode_image(self):
+    def test_episode_image(self, tvdb_banners):
         """Checks episode 'filename' image is fully qualified URL
         """
-        assert self.t['scrubs'][1][1]['filename'].startswith("http://")
+        assert is_artwork_url(tvdb_banners['scrubs'][1][1]['filename'])
 
     @pytest.mark.skip('В новом API у сериала кроме банера больше нет картинок')
-    def test_show_artwork(self):
+    def test_show_artwork(self, tvdb_banners):
         """Checks various image URLs within season data are fully qualified
         """
         for key in ['banner', 'fanart', 'poster']:
-            assert self.t['scrubs'][key].startswith("http://")
+            assert is_artwork_url(tvdb_banners['scrubs'][key])
 
 
 class TestTvdbActors:
-    t = None
-
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), actors=True)
-
-    def test_actors_is_correct_datatype(self):
+    def test_actors_is_correct_datatype(self, tvdb_actors):
         """Check show/_actors key exists and is correct type"""
-        assert isinstance(self.t['scrubs']['_actors'], tvdb_api.Actors)
+        assert isinstance(tvdb_actors['scrubs']['_actors'], tvdb_api.Actors)
 
-    def test_actors_has_actor(self):
+    def test_actors_has_actor(self, tvdb_actors):
         """Check show has at least one Actor
         """
-        assert isinstance(self.t['scrubs']['_actors'][0], tvdb_api.Actor)
+        assert isinstance(tvdb_actors['scrubs']['_actors'][0], tvdb_api.Actor)
 
-    def test_actor_has_name(self):
+    def test_actor_has_name(self, tvdb_actors):
         """Check first actor has a name"""
-        names = [actor['name'] for actor in self.t['scrubs']['_actors']]
+        names = [actor['name'] for actor in tvdb_actors['scrubs']['_actors']]
 
         assert u"Zach Braff" in names
 
-    def test_actor_image_corrected(self):
+    def test_actor_image_corrected(self, tvdb_actors):
         """Check image URL is fully qualified
         """
-        for actor in self.t['scrubs']['_actors']:
-            if actor['image'] is not None:
-                # Actor's image can be None, it displays as the placeholder
-                # image on thetvdb.com
-                assert actor['image'].startswith("http://")
+        # Actor's image can be None, it displays as the placeholder
+        # image on thetvdb.com
+        images = [
+            actor['image']
+            for actor in tvdb_actors['scrubs']['_actors']
+            if actor['image'] is not None
+        ]
+        assert all(map(is_artwork_url, images))
+
+    def test_parallel_actors(self, tvdb_actors, cache_session):
+        """Check actors loaded with parallel_requests match the serially loaded ones
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, actors=True, parallel_requests=True)
+        show = t['scrubs']
+        expected = tvdb_actors['scrubs']
+        assert show['_actors'] == expected['_actors']
+        assert show.data == expected.data
+        assert show == expected
+
+    def test_actors_after_eviction(self, cache_session, monkeypatch):
+        """Check lazily loaded actors still load onto a show evicted from Tvdb.shows
+        """
+        monkeypatch.setattr(tvdb_api.ShowContainer, '_max_shows', 1)
+        t = tvdb_api.Tvdb(cache=cache_session, actors=True)
+        show = t['scrubs']
+        t.shows[-1] = tvdb_api.Show()
+        assert 76156 not in t.shows
+        assert len(show['_actors']) > 0
+        # Nothing was put back into Tvdb.shows, so the show reloads in full
+        assert 76156 not in t.shows
+        assert t['scrubs'][1][1]['episodeName'] == 'My First Day'
+
+    def test_actors_retried_after_failure(self, cache_session, monkeypatch):
+        """Check a failed lazy load of the actors is retried on the next access
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, actors=True)
+        show = t['scrubs']
+
+        def fail_fetch_actors(sid):
+            raise tvdb_api.tvdb_error("request failed")
+
+        monkeypatch.setattr(t, '_fetchActors', fail_fetch_actors)
+        with pytest.raises(tvdb_api.tvdb_error):
+            show['_actors']
+        monkeypatch.undo()
+        assert len(show['_actors']) > 0
+
+    def test_actors_loaded_on_access(self, cache_session):
+        """Check actors are only loaded when the _actors key is first accessed
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, actors=True)
+        show = t['scrubs']
+        assert '_actors' not in show.data
+        assert len(show['_actors']) > 0
+        assert '_actors' in show.data
+
+    def test_pickle_with_pending_actors(self, cache_session):
+        """Check a show with actors not yet loaded can be pickled
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, actors=True, banners=True)
+        show = t['scrubs']
+        loaded = pickle.loads(pickle.dumps(show))
+        assert loaded['seriesName'] == 'Scrubs'
+        assert loaded[1][1]['episodeName'] == 'My First Day'
+        assert len(loaded['_actors']) > 0
+        assert len(loaded['_banners']) > 0
+
+    def test_deepcopy_with_pending_actors(self, cache_session):
+        """Check a copy of a show with actors not yet loaded has its own actors
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, actors=True)
+        show = t['scrubs']
+        copied = copy.deepcopy(show)
+        assert len(copied['_actors']) > 0
+        assert copied['_actors'] is not show['_actors']
+        assert copied[1][1]['episodeName'] == 'My First Day'
+        assert copied[1][1].season.show is copied
 
 
 class TestTvdbDoctest:
@@ -456,25 +511,43 @@ class TestTvdbDoctest:
 
 
 class TestTvdbCustomCaching:
-    def test_true_false_string(self):
+    @pytest.mark.parametrize("cache_val", [True, False, "/tmp"])
+    def test_true_false_string(self, cache_val):
         """Tests setting cache to True/False/string
 
         Basic tests, only checking for errors
         """
-        tvdb_api.Tvdb(cache=True)
-        tvdb_api.Tvdb(cache=False)
-        tvdb_api.Tvdb(cache="/tmp")
+        tvdb_api.Tvdb(cache=cache_val)
+
+    @pytest.mark.parametrize("cache_val", [True, False, "/tmp"])
+    def test_pool_maxsize(self, cache_val):
+        """Tests pool_maxsize is applied to sessions Tvdb creates
+        """
+        t = tvdb_api.Tvdb(cache=cache_val, pool_maxsize=32)
+        assert t.session.get_adapter('https://api.thetvdb.com')._pool_maxsize == 32
+
+    def test_cache_key_ignores_auth_token(self, cache_session):
+        """Tests the cache key depends on Accept-Language but not on the auth token
+        """
+        import requests
+
+        def key(**headers):
+            url = 'https://api.thetvdb.com/series/76156'
+            request = requests.Request('GET', url, headers=headers)
+            return cache_session.cache.create_key(request.prepare())
 
-    def test_invalid_cache_option(self):
+        assert key(**{'Accept-Language': 'en', 'Authorization': 'Bearer a'}) == key(
+            **{'Accept-Language': 'en', 'Authorization': 'Bearer b'}
+        )
+        assert key(**{'Accept-Language': 'en'}) != key(**{'Accept-Language': 'fr'})
+
+    @pytest.mark.parametrize("cache_val", [2.3, 2])
+    def test_invalid_cache_option(self, cache_val):
         """Tests setting cache to invalid value
         """
 
-        try:
-            tvdb_api.Tvdb(cache=2.3)
-        except ValueError:
-            pass
-        else:
-            pytest.fail("Expected ValueError from setting cache to float")
+        with pytest.raises(ValueError):
+            tvdb_api.Tvdb(cache=cache_val)
 
     def test_custom_request_session(self):
         from requests import Session as OriginalSession
@@ -490,77 +563,103 @@ class TestTvdbCustomCaching:
 
         c = CustomCacheForTest()
         t = tvdb_api.Tvdb(cache=c)
-        try:
+        with pytest.raises(Used):
             t['scrubs']
-        except Used:
-            pass
-        else:
-            pytest.fail("Did not use custom session")
 
 
 class TestTvdbById:
-    t = None
-
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), actors=True)
-
-    def test_actors_is_correct_datatype(self):
+    def test_actors_is_correct_datatype(self, tvdb_actors):
         """Check show/_actors key exists and is correct type"""
-        assert self.t[76156]['seriesName'] == 'Scrubs'
+        assert tvdb_actors[76156]['seriesName'] == 'Scrubs'
 
 
 class TestTvdbShowOrdering:
-    def test_ordering(self):
-        """Test Tvdb.search method
+    @pytest.mark.parametrize(
+        "tvdb_fixture,show,expected",
+        [
+            ("tvdb", "Firefly", u"The Train Job"),
+            ("tvdb_dvd", "Firefly", u"Serenity"),
+            ("tvdb", "Batman The Animated Series", u"The Cat and the Claw (1)"),
+            ("tvdb_dvd", "Batman The Animated Series", u"On Leather Wings"),
+        ],
+    )
+    def test_ordering(self, request, tvdb_fixture, show, expected):
+        """Check first episode differs between aired and DVD ordering
         """
-        t_dvd = tvdb_api.Tvdb(cache=get_test_cache_session(), dvdorder=True)
-        t_air = tvdb_api.Tvdb(cache=get_test_cache_session())
-
-        assert u'The Train Job' == t_air['Firefly'][1][1]['episodeName']
-        assert u'Serenity' == t_dvd['Firefly'][1][1]['episodeName']
-
-        assert (
-            u'The Cat and the Claw (1)' == t_air['Batman The Animated Series'][1][1]['episodeName']
-        )
-        assert u'On Leather Wings' == t_dvd['Batman The Animated Series'][1][1]['episodeName']
+        t = request.getfixturevalue(tvdb_fixture)
+        assert t[show][1][1]['episodeName'] == expected
 
 
 class TestTvdbShowSearch:
-    # Used to store the cached instance of Tvdb()
-    t = None
-
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session())
-
-    def test_search(self):
+    def test_search(self, tvdb):
         """Test Tvdb.search method
         """
-        results = self.t.search("my name is earl")
+        results = tvdb.search("my name is earl")
         all_ids = [x['id'] for x in results]
         assert 75397 in all_ids
 
 
 class TestTvdbAltNames:
-    t = None
-
-    @classmethod
-    def setup_class(cls):
-        if cls.t is None:
-            cls.t = tvdb_api.Tvdb(cache=get_test_cache_session(), actors=True)
-
-    def test_1(self):
+    def test_1(self, tvdb_actors):
         """Tests basic access of series name alias
         """
-        results = self.t.search("Don't Trust the B---- in Apartment 23")
+        results = tvdb_actors.search("Don't Trust the B---- in Apartment 23")
         series = results[0]
         assert 'Apartment 23' in series['aliases']
 
 
+class TestTvdbBatchGet:
+    @pytest.mark.parametrize("parallel_requests", [False, True])
+    def test_batch_get(self, tvdb, cache_session, parallel_requests):
+        """Check batch_get returns the same shows as looking each one up
+        """
+        t = tvdb_api.Tvdb(cache=cache_session, parallel_requests=parallel_requests)
+        shows = t.batch_get(['scrubs', 'lost', 'Scrubs', 76156])
+        assert sorted(shows, key=str) == sorted(['scrubs', 'lost', 'Scrubs', 76156], key=str)
+        assert shows['scrubs'] is shows['Scrubs'] is shows[76156]
+        for name in ['scrubs', 'lost']:
+            assert shows[name].data == tvdb[name].data
+            assert shows[name] == tvdb[name]
+
+    @pytest.mark.parametrize("parallel_requests", [False, True])
+    def test_batch_get_more_than_kept(self, cache_session, monkeypatch, parallel_requests):
+        """Check batch_get returns complete shows when Tvdb.shows can't hold them all
+        """
+        monkeypatch.setattr(tvdb_api.ShowContainer, '_max_shows', 1)
+        t = tvdb_api.Tvdb(
+            cache=cache_session, actors=True, parallel_requests=parallel_requests
+        )
+        # Only the actors of Scrubs are in the test cache, so every show gets those
+        scrubs_actors_url = t._urlActorsInfo(76156)
+        monkeypatch.setattr(t, '_urlActorsInfo', lambda sid: scrubs_actors_url)
+        shows = t.batch_get(['scrubs', 'lost'])
+        assert list(t.shows) == [73739]
+        assert shows['scrubs']['seriesName'] == 'Scrubs'
+        assert shows['scrubs'][1][1]['episodeName'] == 'My First Day'
+        assert shows['lost']['seriesName'] == 'Lost'
+        for name in ['scrubs', 'lost']:
+            assert len(shows[name]['_actors']) > 0
+        assert list(t.shows) == [73739]
+
+
+class TestShowContainer:
+    def test_keeps_latest(self):
+        """Check ShowContainer only keeps the 100 most recently set shows
+        """
+        shows = tvdb_api.ShowContainer()
+        for sid in range(150):
+            shows[sid] = tvdb_api.Show()
+        shows[50] = tvdb_api.Show()
+        shows[150] = tvdb_api.Show()
+        assert len(shows) == 100
+        assert 50 in shows
+        assert 51 not in shows
+        assert list(shows)[-2:] == [50, 150]
+
+
 if __name__ == '__main__':
+    from conftest import get_test_cache_session
+
     cache = get_test_cache_session()
     t = tvdb_api.Tvdb(cache=cache)
     t['scrubs'][1][2]
@@ -28,10 +28,25 @@ import tempfile
 import warnings
 import logging
 import hashlib
+import itertools
+import threading
+from collections import OrderedDict
 
 import requests
 import requests_cache
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without the "futures" backport, parallel_requests is unavailable
+    ThreadPoolExecutor = None
+
+try:
+    # Optional faster JSON decoder, used for API responses when installed
+    import orjson
+except ImportError:
+    orjson = None
+
 _DEFAULT_HEADERS = requests.utils.default_headers()
 
 def _to_bytes(s, encoding='utf-8'):
@@ -59,6 +74,18 @@ else:
 
 LOG = logging.getLogger("tvdb_api")
 
+# Series info fields holding a path relative to the artwork URL prefix
+_SERIES_ARTWORK_TAGS = frozenset(['banner', 'fanart', 'poster'])
+
+
+def _decode_json(response):
+    """Decodes the JSON body of a requests response, using orjson
+    if it is available
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
 
 # Exceptions
 
@@ -221,7 +248,7 @@ class ConsoleUI(BaseUI):
         print("TVDB Search Results:")
         for i, cshow in enumerate(toshow):
             i_show = i + 1  # Start at more human readable number 1 (not 0)
-            LOG.debug('Showing allSeries[%s], series %s)' % (i_show, allSeries[i]['seriesName']))
+            LOG.debug('Showing allSeries[%s], series %s)', i_show, allSeries[i]['seriesName'])
             if i == 0:
                 extra = " (default)"
             else:
@@ -260,7 +287,7 @@ class ConsoleUI(BaseUI):
             except EOFError:
                 raise tvdb_userabort("User aborted (EOF received)")
 
-            LOG.debug('Got choice of: %s' % (ans))
+            LOG.debug('Got choice of: %s', ans)
             try:
                 selected_id = int(ans) - 1  # The human entered 1 as first result, not zero
             except ValueError:  # Input was not number
@@ -282,9 +309,9 @@ class ConsoleUI(BaseUI):
                 elif ans.lower() in ["a", "all"]:
                     self._displaySeries(allSeries, limit=None)
                 else:
-                    LOG.debug('Unknown keypress %s' % (ans))
+                    LOG.debug('Unknown keypress %s', ans)
             else:
-                LOG.debug('Trying to return ID: %d' % (selected_id))
+                LOG.debug('Trying to return ID: %d', selected_id)
                 try:
                     return allSeries[selected_id]
                 except IndexError:
@@ -296,27 +323,22 @@ class ConsoleUI(BaseUI):
 # Main API
 
 
-class ShowContainer(dict):
-    """Simple dict that holds a series of Show instances
+class ShowContainer(OrderedDict):
+    """Simple dict that holds a series of Show instances, keeping only
+    the 100 most recently set
     """
 
-    def __init__(self):
-        self._stack = []
-        self._lastgc = time.time()
+    _max_shows = 100
 
     def __setitem__(self, key, value):
-        self._stack.append(key)
-
-        # keep only the 100th latest results
-        if time.time() - self._lastgc > 20:
-            for o in self._stack[:-100]:
-                del self[o]
-            self._stack = self._stack[-100:]
-
-            self._lastgc = time.time()
-
+        if key in self:
+            # re-insert so the key moves to the end (move_to_end is py3 only)
+            del self[key]
         super(ShowContainer, self).__setitem__(key, value)
 
+        while len(self) > self._max_shows:
+            self.popitem(last=False)
+
 
 class Show(dict):
     """Holds a dict of seasons, and show data.
@@ -325,6 +347,10 @@ class Show(dict):
     def __init__(self):
         dict.__init__(self)
         self.data = {}
+        # Built on first aired_on() call, reset by Tvdb._parseShowData
+        self._airdate_index = None
+        self._tvdb = None  # The Tvdb which loads the pending show data
+        self._pending_data = set()  # Keys of show data loaded on first access, e.g _banners
 
     def __repr__(self):
         return "<Show %r (containing %s seasons)>" % (
@@ -337,6 +363,13 @@ class Show(dict):
             # Key is an episode, return it
             return dict.__getitem__(self, key)
 
+        if key not in self.data and key in self._pending_data:
+            # Show data which is only loaded when needed, e.g _banners.
+            # The key stays pending until loading succeeds, so a failed
+            # request is retried on the next access
+            self._loadPendingData(key)
+            self._pending_data.discard(key)
+
         if key in self.data:
             # Non-numeric request is for show-data
             return dict.__getitem__(self.data, key)
@@ -350,12 +383,48 @@ class Show(dict):
             # doesn't exist, so attribute error.
             raise tvdb_attributenotfound("Cannot find attribute %s" % (repr(key)))
 
+    def __getstate__(self):
+        """Loads any pending show data before pickling or copying, as the
+        Tvdb instance which would load it can't be pickled
+        """
+        for key in list(self._pending_data):
+            if key not in self.data:
+                self._loadPendingData(key)
+            self._pending_data.discard(key)
+        state = self.__dict__.copy()
+        state['_tvdb'] = None
+        return state
+
+    def _loadPendingData(self, key):
+        sid = self.data['id']
+        if key == '_banners':
+            self._tvdb._parseBanners(sid, show=self)
+        elif key == '_actors':
+            self._tvdb._parseActors(sid, show=self)
+
     def aired_on(self, date):
-        ret = self.search(str(date), 'firstAired')
+        ret = list(self._getAirdateIndex().get(text_type(date).lower(), []))
+        if len(ret) == 0:
+            # No exact match, fall back to searching (e.g for a partial date)
+            ret = self.search(str(date), 'firstAired')
         if len(ret) == 0:
             raise tvdb_episodenotfound("Could not find any episodes that aired on %s" % date)
         return ret
 
+    def _getAirdateIndex(self):
+        """Returns a dict mapping lower-cased firstAired values to the
+        episodes which aired on that date
+        """
+        if self._airdate_index is None:
+            index = {}
+            for cur_season in self.values():
+                for cur_ep in cur_season.values():
+                    if 'firstAired' in cur_ep:
+                        aired = text_type(dict.__getitem__(cur_ep, 'firstAired')).lower()
+                        index.setdefault(aired, []).append(cur_ep)
+            self._airdate_index = index
+        return self._airdate_index
+
     def search(self, term=None, key=None):
         """
         Search all episodes in show. Can search all data, or a specific key
@@ -497,13 +566,14 @@ class Episode(dict):
             raise TypeError("must supply string to search for (contents)")
 
         term = text_type(term).lower()
-        for cur_key, cur_value in self.items():
-            cur_key = text_type(cur_key)
-            cur_value = text_type(cur_value).lower()
-            if key is not None and cur_key != key:
-                # Do not search this key
-                continue
-            if cur_value.find(text_type(term)) > -1:
+        if key is not None:
+            # Only search the one key, no need to walk the others
+            if key in self and term in text_type(dict.__getitem__(self, key)).lower():
+                return self
+            return None
+
+        for cur_value in self.values():
+            if term in text_type(cur_value).lower():
                 return self
 
 
@@ -585,6 +655,8 @@ class Tvdb:
         userkey=None,
         forceConnect=None,  # noqa
         dvdorder=False,
+        pool_maxsize=20,
+        parallel_requests=False,
     ):
 
         """interactive (True/False):
@@ -608,14 +680,16 @@ class Tvdb:
 
         banners (True/False):
             Retrieves the banners for a show. These are accessed
-            via the _banners key of a Show(), for example:
+            via the _banners key of a Show(), and are loaded the
+            first time that key is accessed, for example:
 
             >>> Tvdb(banners=True)['scrubs']['_banners'].keys()
             [u'fanart', u'poster', u'seasonwide', u'season', u'series']
 
         actors (True/False):
             Retrieves a list of the actors for a show. These are accessed
-            via the _actors key of a Show(), for example:
+            via the _actors key of a Show(), and are loaded the first
+            time that key is accessed, for example:
 
             >>> t = Tvdb(actors=True)
             >>> t['scrubs']['_actors'][0]['name']
@@ -647,6 +721,18 @@ class Tvdb:
         userkey (str/unicode, or None):
             User authentication key relating to "username".
 
+        pool_maxsize (int):
+            Maximum number of connections kept alive per host by the
+            sessions Tvdb creates itself. Has no effect when a custom
+            requests.Session is passed as the cache argument.
+
+        parallel_requests (True/False):
+            When True, independent API requests (such as the banners for
+            each artwork type) are made concurrently from a thread pool,
+            instead of one after another. Banners and actors are then
+            loaded along with the episodes rather than on first access.
+            Requires concurrent.futures (on Python 2, the "futures" backport)
+
         forceConnect:
             DEPRECATED. Disabled the timeout-throttling logic. Now has no function
         """
@@ -690,33 +776,48 @@ class Tvdb:
 
         self.config['dvdorder'] = dvdorder
 
+        if parallel_requests and ThreadPoolExecutor is None:
+            raise ValueError(
+                "parallel_requests requires concurrent.futures (install the futures backport)"
+            )
+        self.config['parallel_requests'] = parallel_requests
+
         if cache is True:
             cache_dir = self._getTempDir()
-            LOG.debug("Caching using requests_cache to %s" % cache_dir)
+            LOG.debug("Caching using requests_cache to %s", cache_dir)
             self.session = requests_cache.CachedSession(
                 expire_after=21600,  # 6 hours
                 backend='sqlite',
                 cache_name=cache_dir,
                 include_get_headers=True,
+                # also cache "Resource not found" responses, so missing
+                # data isn't requested again every time
+                allowable_codes=(200, 404),
             )
             self.session.cache.create_key = types.MethodType(create_key, self.session.cache)
             self.session.remove_expired_responses()
+            self._mountPooledAdapter(pool_maxsize)
             self.config['cache_enabled'] = True
         elif cache is False:
             LOG.debug("Caching disabled")
             self.session = requests.Session()
+            self._mountPooledAdapter(pool_maxsize)
             self.config['cache_enabled'] = False
         elif isinstance(cache, str):
-            LOG.debug("Caching using requests_cache to specified directory %s" % cache)
+            LOG.debug("Caching using requests_cache to specified directory %s", cache)
             # Specified cache path
             self.session = requests_cache.CachedSession(
                 expire_after=21600,  # 6 hours
                 backend='sqlite',
                 cache_name=os.path.join(cache, "tvdb_api"),
                 include_get_headers=True,
+                # also cache "Resource not found" responses, so missing
+                # data isn't requested again every time
+                allowable_codes=(200, 404),
             )
             self.session.cache.create_key = types.MethodType(create_key, self.session.cache)
             self.session.remove_expired_responses()
+            self._mountPooledAdapter(pool_maxsize)
         else:
             LOG.debug("Using specified requests.Session")
             self.session = cache
@@ -756,12 +857,51 @@ class Tvdb:
         )
         self.config['url_artworkPrefix'] = u"%(base_url)s/banners/%%s" % self.config
 
+        # The url_ templates above are kept for backwards compatibility,
+        # requests are built with the _url* methods below instead
+        self._api_url = self.config['api_url']
+
         self.__authorized = False
+        self.__token_expiry = 0
+        self.__auth_lock = threading.Lock()  # Stops concurrent requests logging in twice
         self.headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json',
             'Accept-Language': self.config['language'],
         }
+        # Copies of self.headers, by Accept-Language and Authorization header
+        self._headers_by_lang = {}
+        self._executor = None  # Thread pool for parallel_requests, started on first use
+        self._executor_lock = threading.Lock()
+
+    def _urlGetSeries(self, name):
+        # Quoted with url_quote rather than passed as params=, which would
+        # encode spaces as "+" and so change the URL used as the cache key
+        return u"%s/search/series?name=%s" % (self._api_url, url_quote(name.encode("utf-8")))
+
+    def _urlEpInfo(self, sid):
+        return u"%s/series/%s/episodes" % (self._api_url, sid)
+
+    def _urlSeriesInfo(self, sid):
+        return u"%s/series/%s" % (self._api_url, sid)
+
+    def _urlActorsInfo(self, sid):
+        return u"%s/series/%s/actors" % (self._api_url, sid)
+
+    def _urlSeriesBanner(self, sid):
+        return u"%s/series/%s/images" % (self._api_url, sid)
+
+    def _urlSeriesBannerInfo(self, sid, key_type):
+        return u"%s/series/%s/images/query?keyType=%s" % (self._api_url, sid, key_type)
+
+    def _mountPooledAdapter(self, pool_maxsize):
+        """Mounts an HTTPAdapter with a larger connection pool on
+        self.session, so back-to-back requests reuse kept-alive
+        connections instead of opening new ones
+        """
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def _getTempDir(self):
         """Returns the [system temp dir]/tvdb_api-u501 (or
@@ -779,41 +919,91 @@ class Tvdb:
         return os.path.join(tempfile.gettempdir(), "tvdb_api-%s-py%s" % (uid, py_major))
 
     def _loadUrl(self, url, data=None, recache=False, language=None):
-        """Return response from The TVDB API"""
+        """Return response from The TVDB API, following pagination links"""
+
+        # TODO: Handle Exceptions
 
+        for r_data in self._iterUrlPages(url, language=language):
+            if data and isinstance(data, list):
+                data.extend(r_data)
+            else:
+                data = r_data
+
+        return data
+
+    def _iterUrlPages(self, url, language=None):
+        """Yields the data of each page of a response from The TVDB API,
+        only loading the next page once the previous one was consumed
+        """
         if not language:
             language = self.config['language']
-        self.headers['Accept-Language'] = language
 
-        # TODO: Handle Exceptions
-        # TODO: Update Token
+        base_url = url.split('?')[0]
+        while url:
+            r_data, next_page = self._loadUrlPage(url, language)
+            yield r_data
+
+            if next_page:
+                url = base_url + "?page=%s" % next_page
+            else:
+                url = None
+
+    def _authorizeUnlessCached(self, url, language):
+        """Authorizes the session, unless already authorized with a
+        token that has not expired, or the response for url is already
+        in the cache (in which case no token is needed to load it)
+        """
+        if self.__hasValidToken():
+            return
 
         # encoded url is used for hashing in the cache so
         # python 2 and 3 generate the same hash
-        if not self.__authorized:
-            # only authorize of we haven't before and we
-            # don't have the url in the cache
-            fake_session_for_key = requests.Session()
-            fake_session_for_key.headers['Accept-Language'] = language
-            cache_key = None
-            try:
-                # in case the session class has no cache object, fail gracefully
-                cache_key = self.session.cache.create_key(
-                    fake_session_for_key.prepare_request(requests.Request('GET', url))
-                )
-            except Exception:
-                # FIXME: Can this just check for hasattr(self.session, "cache") instead?
-                pass
-
-            # fmt: off
-            # No fmt because mangles noqa comment - https://github.com/psf/black/issues/195
-            if not cache_key or not self.session.cache.has_key(cache_key): # noqa: not a dict, has_key is part of requests-cache API
-                self.authorize()
-            # fmt: on
+        cache_key = None
+        try:
+            # in case the session class has no cache object, fail gracefully
+            cache_key = self.session.cache.create_key(
+                requests.Request('GET', url, headers={'Accept-Language': language}).prepare()
+            )
+        except Exception:
+            # FIXME: Can this just check for hasattr(self.session, "cache") instead?
+            pass
+
+        # fmt: off
+        # No fmt because mangles noqa comment - https://github.com/psf/black/issues/195
+        if not cache_key or not self.session.cache.has_key(cache_key): # noqa: not a dict, has_key is part of requests-cache API
+            with self.__auth_lock:
+                # Another thread may have authorized while waiting for the lock
+                if not self.__hasValidToken():
+                    self.authorize()
+        # fmt: on
+
+    def __hasValidToken(self):
+        return self.__authorized and time.time() < self.__token_expiry
+
+    def _headersForLanguage(self, language):
+        """Returns the request headers with Accept-Language set to
+        language, without modifying the shared self.headers
+        """
+        # Keyed by the token too, so a copy made by another thread while
+        # authorize() was logging in is never used once it has finished.
+        # The token is read before copying, so the copy is never older
+        key = (language, self.headers.get('Authorization'))
+        headers = self._headers_by_lang.get(key)
+        if headers is None:
+            headers = dict(self.headers)
+            headers['Accept-Language'] = language
+            self._headers_by_lang[key] = headers
+        return headers
+
+    def _loadUrlPage(self, url, language):
+        """Loads a single page from The TVDB API, returns a tuple of
+        the response data and the next page number (or None)
+        """
+        self._authorizeUnlessCached(url, language)
 
-        response = self.session.get(url, headers=self.headers)
-        r = response.json()
-        LOG.debug("loadurl: %s language=%s" % (url, language))
+        response = self.session.get(url, headers=self._headersForLanguage(language))
+        r = _decode_json(response)
+        LOG.debug("loadurl: %s language=%s", url, language)
         LOG.debug("response:")
         LOG.debug(r)
         error = r.get('Error')
@@ -842,31 +1032,25 @@ class Tvdb:
                 # there is just less data (missing translations)
                 pass
 
-        if data and isinstance(data, list):
-            data.extend(r_data)
-        else:
-            data = r_data
-
-        if links and links['next']:
-            url = url.split('?')[0]
-            _url = url + "?page=%s" % links['next']
-            self._loadUrl(_url, data)
-
-        return data
+        next_page = links['next'] if links else None
+        return r_data, next_page
 
     def authorize(self):
         LOG.debug("auth")
         r = self.session.post(
             'https://api.thetvdb.com/login', json=self.config['auth_payload'], headers=self.headers
         )
-        r_json = r.json()
+        r_json = _decode_json(r)
         error = r_json.get('Error')
         if error:
             if error == u'Not Authorized':
                 raise (tvdb_notauthorized)
         token = r_json.get('token')
         self.headers['Authorization'] = "Bearer %s" % text_type(token)
+        self._headers_by_lang.clear()
         self.__authorized = True
+        # Tokens are valid for 24 hours, refresh an hour early
+        self.__token_expiry = time.time() + 23 * 60 * 60
 
     def _getetsrc(self, url, language=None):
         """Loads a URL using caching, returns an ElementTree of the source
@@ -875,43 +1059,64 @@ class Tvdb:
 
         return src
 
-    def _setItem(self, sid, seas, ep, attrib, value):
-        """Creates a new episode, creating Show(), Season() and
-        Episode()s as required. Called by _getShowData to populate show
-
-        Since the nice-to-use tvdb[1][24]['name] interface
-        makes it impossible to do tvdb[1][24]['name] = "name"
-        and still be capable of checking if an episode exists
-        so we can raise tvdb_shownotfound, we have a slightly
-        less pretty method of setting items.. but since the API
-        is supposed to be read-only, this is the best way to
-        do it!
-        The problem is that calling tvdb[1][24]['episodename'] = "name"
-        calls __getitem__ on tvdb[1], there is no way to check if
-        tvdb.__dict__ should have a key "1" before we auto-create it
+    def _callAll(self, calls):
+        """Calls each of the given no-argument functions, concurrently if
+        parallel_requests is enabled. Returns the results in the same
+        order as calls
+
+        All calls share one pool of 8 threads, including calls made from
+        inside another call. A call which no thread has started yet is run
+        by the thread waiting for it instead, so nested calls can't leave
+        the whole pool waiting on calls queued behind them
         """
-        if sid not in self.shows:
-            self.shows[sid] = Show()
-        if seas not in self.shows[sid]:
-            self.shows[sid][seas] = Season(show=self.shows[sid])
-        if ep not in self.shows[sid][seas]:
-            self.shows[sid][seas][ep] = Episode(season=self.shows[sid][seas])
-        self.shows[sid][seas][ep][attrib] = value
-
-    def _setShowData(self, sid, key, value):
+        if not self.config['parallel_requests'] or len(calls) < 2:
+            return [call() for call in calls]
+
+        executor = self._getExecutor()
+        futures = [executor.submit(call) for call in calls]
+        results = []
+        for call, future in zip(calls, futures):
+            if future.cancel():
+                results.append(call())
+            else:
+                results.append(future.result())
+        return results
+
+    def _getExecutor(self):
+        """Returns the thread pool used by _callAll, starting it if needed
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=8)
+            return self._executor
+
+    def _getetsrcAll(self, urls, language=None):
+        """Loads several URLs with _getetsrc, concurrently if
+        parallel_requests is enabled. Returns the responses in the same
+        order as urls
+        """
+        return self._callAll(
+            [lambda url=url: self._getetsrc(url, language=language) for url in urls]
+        )
+
+    def _setShowData(self, sid, key, value, show=None):
         """Sets self.shows[sid] to a new Show instance, or sets the data
+
+        If show is given, the data is set on it instead of self.shows[sid]
+        (which it may no longer be, once evicted from the ShowContainer)
         """
-        if sid not in self.shows:
-            self.shows[sid] = Show()
-        self.shows[sid].data[key] = value
+        if show is None:
+            show = self.shows.get(sid)
+            if show is None:
+                show = self.shows[sid] = Show()
+        show.data[key] = value
 
     def search(self, series):
         """This searches TheTVDB.com for the series name
         and returns the result list
         """
-        series = url_quote(series.encode("utf-8"))
-        LOG.debug("Searching for show %s" % series)
-        series_resp = self._getetsrc(self.config['url_getSeries'] % (series))
+        LOG.debug("Searching for show %s", series)
+        series_resp = self._getetsrc(self._urlGetSeries(series))
         if not series_resp:
             LOG.debug('Series result returned zero')
             raise tvdb_shownotfound(
@@ -921,7 +1126,7 @@ class Tvdb:
         all_series = []
         for series in series_resp:
             series['language'] = self.config['language']
-            LOG.debug('Found series %(seriesName)s' % series)
+            LOG.debug('Found series %(seriesName)s', series)
             all_series.append(series)
 
         return all_series
@@ -932,10 +1137,14 @@ class Tvdb:
         series. If not, and interactive == True, ConsoleUI is used, if not
         BaseUI is used to select the first result.
         """
-        all_series = self.search(series)
+        return self._selectSeries(self.search(series))
 
+    def _selectSeries(self, all_series):
+        """Selects one of the series search results, using the UI
+        described in _getSeries
+        """
         if self.config['custom_ui'] is not None:
-            LOG.debug("Using custom UI %s" % (repr(self.config['custom_ui'])))
+            LOG.debug("Using custom UI %r", self.config['custom_ui'])
             ui = self.config['custom_ui'](config=self.config)
         else:
             if not self.config['interactive']:
@@ -955,7 +1164,17 @@ class Tvdb:
         languages = [x['abbreviation'] for x in et]
         return sorted(languages)
 
-    def _parseBanners(self, sid):
+    def _fetchBanners(self, sid):
+        """Loads the banner list for each artwork type of a show, for
+        passing to _parseBanners
+        """
+        LOG.debug('Getting season banners for %s', sid)
+        banners_resp = self._getetsrc(self._urlSeriesBanner(sid))
+        return self._getetsrcAll(
+            [self._urlSeriesBannerInfo(sid, cur_banner) for cur_banner in banners_resp.keys()]
+        )
+
+    def _parseBanners(self, sid, all_banners_info=None, show=None):
         """Parses banners XML, from
         http://thetvdb.com/api/[APIKEY]/series/[SERIES ID]/banners.xml
 
@@ -972,12 +1191,17 @@ class Tvdb:
         data from the XML)
 
         This interface will be improved in future versions.
+
+        all_banners_info can be given when the banners were already
+        loaded with _fetchBanners, and show to set the banners on that
+        Show rather than self.shows[sid]
         """
-        LOG.debug('Getting season banners for %s' % (sid))
-        banners_resp = self._getetsrc(self.config['url_seriesBanner'] % sid)
+        if all_banners_info is None:
+            all_banners_info = self._fetchBanners(sid)
+
+        artwork_fmt = self.config['url_artworkPrefix']
         banners = {}
-        for cur_banner in banners_resp.keys():
-            banners_info = self._getetsrc(self.config['url_seriesBannerInfo'] % (sid, cur_banner))
+        for banners_info in all_banners_info:
             for banner_info in banners_info:
                 bid = banner_info.get('id')
                 btype = banner_info.get('keyType')
@@ -999,14 +1223,20 @@ class Tvdb:
                 for k, v in list(banners[btype][btype2][bid].items()):
                     if k.endswith("path"):
                         new_key = "_%s" % k
-                        LOG.debug("Transforming %s to %s" % (k, new_key))
-                        new_url = self.config['url_artworkPrefix'] % v
+                        LOG.debug("Transforming %s to %s", k, new_key)
+                        new_url = artwork_fmt % v
                         banners[btype][btype2][bid][new_key] = new_url
 
             banners[btype]['raw'] = banners_info
-            self._setShowData(sid, "_banners", banners)
+            self._setShowData(sid, "_banners", banners, show=show)
+
+    def _fetchActors(self, sid):
+        """Loads the actors of a show, for passing to _parseActors
+        """
+        LOG.debug("Getting actors for %s", sid)
+        return self._getetsrc(self._urlActorsInfo(sid))
 
-    def _parseActors(self, sid):
+    def _parseActors(self, sid, actors_resp=None, show=None):
         """Parsers actors XML, from
         http://thetvdb.com/api/[APIKEY]/series/[SERIES ID]/actors.xml
 
@@ -1030,84 +1260,149 @@ class Tvdb:
 
         Any key starting with an underscore has been processed (not the raw
         data from the XML)
+
+        actors_resp can be given when the actors were already loaded
+        with _fetchActors, and show to set the actors on that Show
+        rather than self.shows[sid]
         """
-        LOG.debug("Getting actors for %s" % (sid))
-        actors_resp = self._getetsrc(self.config['url_actorsInfo'] % (sid))
-
-        cur_actors = Actors()
-        for cur_actor_item in actors_resp:
-            cur_actor = Actor()
-            for tag, value in cur_actor_item.items():
-                if value is not None:
-                    if tag == "image":
-                        value = self.config['url_artworkPrefix'] % (value)
-                cur_actor[tag] = value
-            cur_actors.append(cur_actor)
-        self._setShowData(sid, '_actors', cur_actors)
+        if actors_resp is None:
+            actors_resp = self._fetchActors(sid)
+
+        artwork_fmt = self.config['url_artworkPrefix']
+        cur_actors = Actors(
+            self._buildActor(cur_actor_item, artwork_fmt) for cur_actor_item in actors_resp
+        )
+        self._setShowData(sid, '_actors', cur_actors, show=show)
+
+    def _buildActor(self, actor_item, artwork_fmt):
+        """Creates an Actor from an item of the actors response, with
+        the image expanded to a full URL
+        """
+        cur_actor = Actor(actor_item)
+        image = cur_actor.get('image')
+        if image is not None:
+            cur_actor['image'] = artwork_fmt % (image)
+        return cur_actor
 
     def _getShowData(self, sid, language):
         """Takes a series ID, gets the epInfo URL and parses the TVDB
         XML file into the shows dict in layout:
         shows[series_id][season_number][episode_number]
+
+        Returns the Show
         """
+        return self._parseShowData(sid, self._fetchShowData(sid, language))
 
-        if self.config['language'] is None:
+    def _fetchShowData(self, sid, language):
+        """Loads the series info, episodes and (with parallel_requests) the
+        banners and actors of a show, for passing to _parseShowData.
+
+        Only makes requests, so may be called from several threads at once
+        """
+        config = self.config
+        config_language = config['language']
+
+        if config_language is None:
             LOG.debug('Config language is none, using show language')
             if language is None:
                 raise tvdb_error("config['language'] was None, this should not happen")
         else:
             LOG.debug(
-                'Configured language %s override show language of %s'
-                % (self.config['language'], language)
+                'Configured language %s override show language of %s',
+                config_language,
+                language,
             )
 
-        # Parse show information
-        LOG.debug('Getting all series data for %s' % (sid))
-        series_info_resp = self._getetsrc(self.config['url_seriesInfo'] % sid)
-        for tag, value in series_info_resp.items():
-            if value is not None:
-                if tag in ['banner', 'fanart', 'poster']:
-                    value = self.config['url_artworkPrefix'] % (value)
-
-            self._setShowData(sid, tag, value)
-        # set language
-        self._setShowData(sid, u'language', self.config['language'])
+        # Load series info first, so an unknown show ID errors out before
+        # anything else is requested
+        LOG.debug('Getting all series data for %s', sid)
+        series_info_resp = self._getetsrc(self._urlSeriesInfo(sid))
+
+        LOG.debug('Getting all episodes of %s', sid)
+        banners_resp = actors_resp = None
+        if config['parallel_requests']:
+            # The episodes, banners and actors don't depend on each other, so
+            # are loaded concurrently
+            fetches = [lambda: self._getetsrc(self._urlEpInfo(sid), language=language)]
+            if config['banners_enabled']:
+                fetches.append(lambda: self._fetchBanners(sid))
+            if config['actors_enabled']:
+                fetches.append(lambda: self._fetchActors(sid))
+            fetched = self._callAll(fetches)
+            eps_resp = fetched.pop(0)
+            if config['banners_enabled']:
+                banners_resp = fetched.pop(0)
+            if config['actors_enabled']:
+                actors_resp = fetched.pop(0)
+        else:
+            # Load episodes a page at a time while parsing them, rather
+            # than holding every page of the response at once
+            eps_resp = itertools.chain.from_iterable(
+                self._iterUrlPages(self._urlEpInfo(sid), language=language)
+            )
 
-        # Parse banners
-        if self.config['banners_enabled']:
-            self._parseBanners(sid)
+        return series_info_resp, banners_resp, actors_resp, eps_resp
 
-        # Parse actors
-        if self.config['actors_enabled']:
-            self._parseActors(sid)
+    def _parseShowData(self, sid, fetched):
+        """Parses the responses from _fetchShowData into the Show for sid,
+        creating it in self.shows if needed. Banners and actors which were
+        not fetched are loaded once first accessed.
 
-        # Parse episode data
-        LOG.debug('Getting all episodes of %s' % (sid))
+        Returns the Show
+        """
+        config = self.config
+        dvdorder = config['dvdorder']
+        artwork_fmt = config['url_artworkPrefix']
+        series_info_resp, banners_resp, actors_resp, eps_resp = fetched
 
-        url = self.config['url_epInfo'] % sid
+        # Parse show information
+        show = self.shows.get(sid)
+        if show is None:
+            show = self.shows[sid] = Show()
+        show.data.update(series_info_resp)
+        for tag in _SERIES_ARTWORK_TAGS:
+            value = series_info_resp.get(tag)
+            if value is not None:
+                show.data[tag] = artwork_fmt % (value)
+        # set language
+        show.data[u'language'] = config['language']
+
+        # Parse banners and actors. Unless they were already loaded along
+        # with the episodes, they are only loaded once first accessed
+        show._tvdb = self
+        if config['banners_enabled']:
+            if banners_resp is not None:
+                self._parseBanners(sid, banners_resp, show=show)
+            else:
+                show._pending_data.add('_banners')
 
-        eps_resp = self._getetsrc(url, language=language)
+        if config['actors_enabled']:
+            if actors_resp is not None:
+                self._parseActors(sid, actors_resp, show=show)
+            else:
+                show._pending_data.add('_actors')
 
+        # Parse episode data
+        if dvdorder:
+            LOG.debug('Using DVD ordering.')
         for cur_ep in eps_resp:
 
-            if self.config['dvdorder']:
-                LOG.debug('Using DVD ordering.')
-                use_dvd = (
-                    cur_ep.get('dvdSeason') is not None
-                    and cur_ep.get('dvdEpisodeNumber') is not None
-                )
+            if dvdorder:
+                dvd_seasnum, dvd_epno = cur_ep.get('dvdSeason'), cur_ep.get('dvdEpisodeNumber')
+                use_dvd = dvd_seasnum is not None and dvd_epno is not None
             else:
                 use_dvd = False
 
             if use_dvd:
-                elem_seasnum, elem_epno = cur_ep.get('dvdSeason'), cur_ep.get('dvdEpisodeNumber')
+                elem_seasnum, elem_epno = dvd_seasnum, dvd_epno
             else:
                 elem_seasnum, elem_epno = cur_ep['airedSeason'], cur_ep['airedEpisodeNumber']
 
             if elem_seasnum is None or elem_epno is None:
                 LOG.warning(
-                    "An episode has incomplete season/episode number (season: %r, episode: %r)"
-                    % (elem_seasnum, elem_epno)
+                    "An episode has incomplete season/episode number (season: %r, episode: %r)",
+                    elem_seasnum,
+                    elem_epno,
                 )
                 # TODO: Should this happen?
                 continue  # Skip to next episode
@@ -1115,33 +1410,108 @@ class Tvdb:
             seas_no = elem_seasnum
             ep_no = elem_epno
 
-            for cur_item in cur_ep.keys():
-                tag = cur_item
-                value = cur_ep[cur_item]
-                if value is not None:
-                    if tag == 'filename':
-                        value = self.config['url_artworkPrefix'] % (value)
-                self._setItem(sid, seas_no, ep_no, tag, value)
+            # Create the season and episode if needed, then set every
+            # field at once
+            season = show.get(seas_no)
+            if season is None:
+                season = show[seas_no] = Season(show=show)
+            episode = season.get(ep_no)
+            if episode is None:
+                episode = season[ep_no] = Episode(season=season)
+            episode.update(cur_ep)
+            filename = cur_ep.get('filename')
+            if filename is not None:
+                episode['filename'] = artwork_fmt % (filename)
+
+        # The episodes changed, so aired_on() must rebuild its index
+        show._airdate_index = None
+        return show
+
+    def _getCorrection(self, name):
+        """Returns the series ID name was corrected to, or None. Searches
+        are case-insensitive, so names are stored lower-cased and e.g
+        'Scrubs' and 'scrubs' share one entry. Names set in
+        self.corrections by hand are also matched exactly
+        """
+        for correction_key in (name.lower(), name):
+            if correction_key in self.corrections:
+                return self.corrections[correction_key]
+        return None
 
     def _nameToSid(self, name):
         """Takes show name, returns the correct series ID (if the show has
         already been grabbed), or grabs all episodes and returns
         the correct SID.
         """
-        if name in self.corrections:
-            LOG.debug('Correcting %s to %s' % (name, self.corrections[name]))
-            sid = self.corrections[name]
+        sid = self._getCorrection(name)
+        if sid is not None:
+            LOG.debug('Correcting %s to %s', name, sid)
         else:
-            LOG.debug('Getting show %s' % name)
+            LOG.debug('Getting show %s', name)
             selected_series = self._getSeries(name)
             sid = selected_series['id']
-            LOG.debug('Got %(seriesName)s, id %(id)s' % selected_series)
+            LOG.debug('Got %(seriesName)s, id %(id)s', selected_series)
 
-            self.corrections[name] = sid
-            self._getShowData(selected_series['id'], self.config['language'])
+            self.corrections[name.lower()] = sid
+            if sid not in self.shows:
+                # Another name may already have resolved to this show
+                self._getShowData(sid, self.config['language'])
 
         return sid
 
+    def batch_get(self, names):
+        """Looks up several shows at once, returning a dict mapping each
+        of the names (or series IDs) to its Show, the same as
+        tvdb_instance[name] would return.
+
+        With parallel_requests enabled, the searches for the names and then
+        the requests for the shows are made concurrently. Selecting a series
+        from the search results (which may prompt the user) and parsing the
+        shows is always done one at a time.
+
+        >>> t = Tvdb(parallel_requests=True)
+        >>> shows = t.batch_get(['scrubs', 'lost'])
+        >>> shows['lost']['seriesName']
+        u'Lost'
+        """
+        names = list(names)
+
+        # Search for the names which were not looked up before
+        to_search = OrderedDict()
+        for name in names:
+            if not isinstance(name, int_types) and self._getCorrection(name) is None:
+                to_search.setdefault(name.lower(), name)
+        all_results = self._callAll(
+            [lambda name=name: self.search(name) for name in to_search.values()]
+        )
+        for correction_key, all_series in zip(to_search, all_results):
+            self.corrections[correction_key] = self._selectSeries(all_series)['id']
+
+        sids = OrderedDict()
+        for name in names:
+            if isinstance(name, int_types):
+                sids[name] = name
+            else:
+                sids[name] = self._getCorrection(name)
+
+        # Load each show not already loaded, only once even if several
+        # names resolved to it
+        shows = {}
+        to_load = []
+        for sid in sids.values():
+            if sid in self.shows:
+                shows[sid] = self.shows[sid]
+            elif sid not in to_load:
+                to_load.append(sid)
+        language = self.config['language']
+        all_fetched = self._callAll(
+            [lambda sid=sid: self._fetchShowData(sid, language) for sid in to_load]
+        )
+        for sid, fetched in zip(to_load, all_fetched):
+            shows[sid] = self._parseShowData(sid, fetched)
+
+        return dict((name, shows[sid]) for name, sid in sids.items())
+
     def __getitem__(self, key):
         """Handles tvdb_instance['seriesName'] calls.
         The dict index should be the show id
@@ -1150,7 +1520,7 @@ class Tvdb:
             sid = key
         else:
             sid = self._nameToSid(key)
-            LOG.debug('Got series id %s' % sid)
+            LOG.debug('Got series id %s', sid)
 
         if sid not in self.shows:
             self._getShowData(sid, self.config['language'])